@@ -0,0 +1,13 @@
+"""PlatformIO extra script: route compilation through ccache.
+
+Injected via PLATFORMIO_EXTRA_SCRIPTS by evolve.py when ccache is on
+PATH, so warm framework/library objects are reused across generation
+branches instead of being recompiled from scratch.
+"""
+
+Import("env")  # noqa: F821 - provided by SCons
+
+env.Replace(
+    CC="ccache " + env["CC"],
+    CXX="ccache " + env["CXX"],
+)
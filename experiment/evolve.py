@@ -23,8 +23,13 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
+import time
+import asyncio
+import hashlib
+import shutil
 import subprocess
 import argparse
 from pathlib import Path
@@ -38,6 +43,50 @@ except ImportError:
     GEMINI_AVAILABLE = False
     print("Warning: google-generativeai not installed. Run: pip install google-generativeai")
 
+try:
+    from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+    TRANSIENT_EXCEPTIONS = (ResourceExhausted, ServiceUnavailable)
+except ImportError:
+    TRANSIENT_EXCEPTIONS = ()
+
+# pygit2 answers read-only ref queries in-process (one repo open, then
+# memory lookups) instead of forking git 50-150ms at a time
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+# Pillow lets us shrink multi-MB camera captures before uploading them
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# orjson parses/serializes critique payloads several times faster than
+# stdlib json; everything falls back to stdlib when it's missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data):
+    """Parse JSON with orjson when installed, stdlib otherwise."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to a JSON string with orjson when installed, stdlib otherwise."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -48,20 +97,94 @@ CONFIG = {
     "sim_header": "include/CitySim.h",
     "captures_dir": Path(__file__).parent / "captures",
     "generations_dir": Path(__file__).parent / "generations",
+    "worktrees_dir": Path(__file__).parent / "worktrees",
     "platformio_env": "tdisplay",
     "gemini_model": "gemini-2.0-flash",
     "default_line": "alpha",
+    "max_concurrency": 4,   # simultaneous Gemini requests
+    "rpm": 10,              # Gemini requests per minute (free tier quota)
+    "use_cache": True,      # reuse cached critiques for identical images
+    "regress_tolerance": 1.0,  # allowed overall-score drop before a generation is rejected
+    "use_branches": True,   # git branch per generation (--no-branches for the simple flow)
 }
 
+# ============================================================================
+# RATE LIMITING - Keep concurrent Gemini calls under the RPM quota
+# ============================================================================
+
+class RateLimiter:
+    """Enforce a minimum interval between calls (simple token bucket)."""
+
+    def __init__(self, rpm: float):
+        self.min_interval = 60.0 / rpm
+        self.last_call_ts = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            wait = self.last_call_ts + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self.last_call_ts = time.monotonic()
+
+
+# Created lazily so --rpm/--concurrency flags can adjust CONFIG first
+GEMINI_SEM = None
+GEMINI_LIMITER = None
+
+def gemini_throttle():
+    """Return the shared (semaphore, rate limiter) pair, creating on first use."""
+    global GEMINI_SEM, GEMINI_LIMITER
+    if GEMINI_SEM is None:
+        GEMINI_SEM = asyncio.Semaphore(CONFIG["max_concurrency"])
+        GEMINI_LIMITER = RateLimiter(CONFIG["rpm"])
+    return GEMINI_SEM, GEMINI_LIMITER
+
+
+def is_transient(exc: Exception) -> bool:
+    """Classify an exception as retryable (rate limit / transient outage)."""
+    if TRANSIENT_EXCEPTIONS and isinstance(exc, TRANSIENT_EXCEPTIONS):
+        return True
+    msg = str(exc).lower()
+    return any(s in msg for s in ("429", "quota", "rate", "503", "unavailable", "timeout"))
+
+
+async def with_retry(coro_factory, max_attempts: int = 3, base: float = 2.0, cap: float = 30.0):
+    """Await coro_factory() with bounded exponential backoff on transient errors."""
+    for attempt in range(max_attempts):
+        try:
+            return await coro_factory()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_transient(e):
+                raise
+            delay = min(cap, base * 2 ** attempt)
+            print(f"⏳ Transient error: {e}")
+            print(f"   Retrying in {delay:.0f}s (attempt {attempt + 2}/{max_attempts})...")
+            await asyncio.sleep(delay)
+
 # ============================================================================
 # GIT MANAGEMENT - Branch-based evolution tracking
 # ============================================================================
 
-def git_run(*args, check=True):
+# Compiled once; matches evo-{line}-{generation} (line names may contain dashes)
+EVO_BRANCH_RE = re.compile(r"^evo-(?P<line>.+)-(?P<gen>\d{3})$")
+
+# Long-lived repository handle for read-only queries (side-effecting
+# operations - checkout, commit, worktrees - stay on the git CLI)
+_REPO = None
+
+def get_repo():
+    """Open the repo once via pygit2, or None when it isn't installed."""
+    global _REPO
+    if _REPO is None and PYGIT2_AVAILABLE:
+        _REPO = pygit2.Repository(str(CONFIG["project_root"]))
+    return _REPO
+
+def git_run(*args, check=True, cwd=None):
     """Run a git command and return output."""
     result = subprocess.run(
         ["git"] + list(args),
-        cwd=CONFIG["project_root"],
+        cwd=cwd or CONFIG["project_root"],
         capture_output=True,
         text=True
     )
@@ -69,13 +192,45 @@ def git_run(*args, check=True):
         raise RuntimeError(f"Git command failed: {result.stderr}")
     return result
 
+async def git_run_async(*args, check=True):
+    """Async variant of git_run for running independent git queries concurrently."""
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=CONFIG["project_root"],
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    result = subprocess.CompletedProcess(
+        ["git"] + list(args), proc.returncode, stdout.decode(), stderr.decode()
+    )
+    if check and result.returncode != 0:
+        raise RuntimeError(f"Git command failed: {result.stderr}")
+    return result
+
 def get_current_branch() -> str:
     """Get the current git branch name."""
+    repo = get_repo()
+    if repo is not None:
+        return repo.head.shorthand
     result = git_run("rev-parse", "--abbrev-ref", "HEAD")
     return result.stdout.strip()
 
+def list_evo_branches(line: str = None) -> list:
+    """List evolution branches without one subprocess per branch."""
+    prefix = f"evo-{line}-" if line else "evo-"
+    repo = get_repo()
+    if repo is not None:
+        return [b for b in repo.branches.local if b.startswith(prefix)]
+    result = git_run("for-each-ref", "--format=%(refname:short)",
+                     f"refs/heads/{prefix}*", check=False)
+    return [b for b in result.stdout.strip().split("\n") if b]
+
 def branch_exists(branch_name: str) -> bool:
     """Check if a branch exists."""
+    repo = get_repo()
+    if repo is not None:
+        return branch_name in repo.branches.local
     result = git_run("branch", "--list", branch_name, check=False)
     return bool(result.stdout.strip())
 
@@ -83,22 +238,24 @@ def get_branch_name(line: str, generation: int) -> str:
     """Generate branch name for a given line and generation."""
     return f"evo-{line}-{generation:03d}"
 
+def get_parent_branch(line: str, generation: int) -> str:
+    """Branch a new generation should grow from."""
+    if generation == 1:
+        return "seed" if tag_exists("seed") else "main"
+    return get_branch_name(line, generation - 1)
+
 def get_latest_generation(line: str) -> int:
     """Find the latest generation number for an evolution line."""
-    result = git_run("branch", "--list", f"evo-{line}-*", check=False)
-    branches = result.stdout.strip().split("\n")
-    branches = [b.strip().replace("* ", "") for b in branches if b.strip()]
+    branches = list_evo_branches(line)
 
     if not branches:
         return 0
 
     generations = []
     for b in branches:
-        try:
-            gen_num = int(b.split("-")[-1])
-            generations.append(gen_num)
-        except ValueError:
-            continue
+        match = EVO_BRANCH_RE.match(b)
+        if match:
+            generations.append(int(match.group("gen")))
 
     return max(generations) if generations else 0
 
@@ -113,10 +270,7 @@ def create_generation_branch(line: str, generation: int, parent_branch: str = No
 
     # Determine parent branch
     if parent_branch is None:
-        if generation == 1:
-            parent_branch = "seed" if tag_exists("seed") else "main"
-        else:
-            parent_branch = get_branch_name(line, generation - 1)
+        parent_branch = get_parent_branch(line, generation)
 
     print(f"🌿 Creating branch {branch_name} from {parent_branch}")
 
@@ -128,21 +282,70 @@ def create_generation_branch(line: str, generation: int, parent_branch: str = No
 
     return branch_name
 
+def create_generation_worktree(line: str, generation: int, parent_branch: str = None) -> Path:
+    """Check the generation branch out into its own worktree.
+
+    'git worktree add' shares the main repo's object store - no clone, no
+    duplicate history - so each generation gets an isolated working
+    directory at near-zero disk cost, and the primary checkout is never
+    disturbed mid-cycle.
+    """
+    branch_name = get_branch_name(line, generation)
+    wt_path = CONFIG["worktrees_dir"] / branch_name
+
+    if wt_path.exists():
+        print(f"⚠️  Worktree {wt_path} already exists, reusing")
+        return wt_path
+
+    # Determine parent branch (same rules as create_generation_branch)
+    if parent_branch is None:
+        parent_branch = get_parent_branch(line, generation)
+
+    wt_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if branch_exists(branch_name):
+        print(f"🌿 Adding worktree for existing branch {branch_name}")
+        git_run("worktree", "add", str(wt_path), branch_name)
+    else:
+        print(f"🌿 Adding worktree {branch_name} from {parent_branch}")
+        git_run("worktree", "add", "-b", branch_name, str(wt_path), parent_branch)
+
+    return wt_path
+
+def bootstrap_shallow(dest: str):
+    """Shallow-clone the seed snapshot into a fresh directory.
+
+    For spinning up an evolution line on another machine: --depth 1
+    --single-branch carries only the seed revision, not the repo's
+    history. Within this checkout, prefer worktrees - they share the
+    object store and are cheaper still.
+    """
+    ref = "seed" if tag_exists("seed") else get_current_branch()
+    print(f"🌱 Shallow-cloning {ref} into {dest}")
+    # file:// forces the transport that honors --depth; plain local
+    # paths silently clone the full history
+    git_run("clone", "--depth", "1", "--single-branch", "--branch", ref,
+            f"file://{CONFIG['project_root'].resolve()}", dest)
+    print(f"✅ Bootstrap complete: {dest}")
+
 def tag_exists(tag_name: str) -> bool:
     """Check if a tag exists."""
+    repo = get_repo()
+    if repo is not None:
+        return f"refs/tags/{tag_name}" in repo.references
     result = git_run("tag", "--list", tag_name, check=False)
     return bool(result.stdout.strip())
 
-def commit_generation(line: str, generation: int, critique: dict):
+def commit_generation(line: str, generation: int, critique: dict, cwd: Path = None):
     """Commit the mutated code for this generation."""
     scores = critique.get("scores", {})
     overall = critique.get("overall_score", "?")
 
     # Stage changes
-    git_run("add", "-A")
+    git_run("add", "-A", cwd=cwd)
 
     # Check if there are changes to commit
-    result = git_run("diff", "--cached", "--quiet", check=False)
+    result = git_run("diff", "--cached", "--quiet", check=False, cwd=cwd)
     if result.returncode == 0:
         print("ℹ️  No changes to commit")
         return
@@ -150,7 +353,7 @@ def commit_generation(line: str, generation: int, critique: dict):
     # Create commit message
     commit_msg = f"""Generation {generation} ({line} line)
 
-Scores: {json.dumps(scores)}
+Scores: {json_dumps(scores)}
 Overall: {overall}/10
 
 Critique: {critique.get('critique', 'N/A')}
@@ -158,26 +361,38 @@ Critique: {critique.get('critique', 'N/A')}
 🧬 Evolved with Nocturnal City Evolution
 """
 
-    git_run("commit", "-m", commit_msg)
+    git_run("commit", "-m", commit_msg, cwd=cwd)
     print(f"✅ Committed generation {generation}")
 
-def show_evolution_status():
+async def show_evolution_status():
     """Display the current evolution status."""
     print("\n" + "="*60)
     print("🧬 EVOLUTION STATUS")
     print("="*60)
 
-    # Check for seed tag
-    if tag_exists("seed"):
+    if PYGIT2_AVAILABLE:
+        # In-process ref lookups - no subprocesses at all
+        seed_exists = tag_exists("seed")
+        current_branch = get_current_branch()
+        branches = list_evo_branches()
+    else:
+        # Independent lookups: seed tag, current branch, and branch list
+        # can all run at once
+        seed_result, head_result, branch_result = await asyncio.gather(
+            git_run_async("tag", "--list", "seed", check=False),
+            git_run_async("rev-parse", "--abbrev-ref", "HEAD"),
+            git_run_async("for-each-ref", "--format=%(refname:short)",
+                          "refs/heads/evo-*", check=False),
+        )
+        seed_exists = bool(seed_result.stdout.strip())
+        current_branch = head_result.stdout.strip()
+        branches = [b for b in branch_result.stdout.strip().split("\n") if b]
+
+    if seed_exists:
         print("\n✅ Seed tag exists")
     else:
         print("\n⚠️  No seed tag found. Run with --init to create it.")
 
-    # Find all evolution lines
-    result = git_run("branch", "--list", "evo-*", check=False)
-    branches = result.stdout.strip().split("\n")
-    branches = [b.strip().replace("* ", "") for b in branches if b.strip()]
-
     if not branches:
         print("\n📭 No evolution branches yet.")
         print("   Start with: python evolve.py --line alpha <image>")
@@ -186,27 +401,29 @@ def show_evolution_status():
     # Group by line
     lines = {}
     for b in branches:
-        parts = b.split("-")
-        if len(parts) >= 3:
-            line = parts[1]
-            gen = int(parts[2])
-            if line not in lines:
-                lines[line] = []
-            lines[line].append(gen)
+        match = EVO_BRANCH_RE.match(b)
+        if match:
+            lines.setdefault(match.group("line"), []).append(int(match.group("gen")))
 
     print(f"\n📊 Evolution Lines ({len(lines)} total):\n")
     for line, gens in sorted(lines.items()):
         latest = max(gens)
         print(f"   {line}: {len(gens)} generations (latest: {latest})")
 
+        # Score trend from the append-only index
+        history = load_history(line)
+        if history:
+            trend = " → ".join(str(e.get("overall", "?")) for e in history[-5:])
+            print(f"      scores: {trend}")
+
         # Show recent generations
         recent = sorted(gens, reverse=True)[:5]
         for g in recent:
             branch = get_branch_name(line, g)
-            current = " ← current" if branch == get_current_branch() else ""
+            current = " ← current" if branch == current_branch else ""
             print(f"      └─ gen {g:03d}{current}")
 
-    print(f"\n📍 Current branch: {get_current_branch()}")
+    print(f"\n📍 Current branch: {current_branch}")
 
 # ============================================================================
 # GEMINI CRITIC - Rates the visual aesthetics
@@ -240,8 +457,78 @@ Return ONLY a valid JSON object with this exact schema:
 }
 """
 
-def critique_image(image_path: str) -> dict:
-    """Send image to Gemini Vision and get aesthetic critique."""
+# Built once and reused: repeated GenerativeModel construction re-pays
+# SDK setup per call, and a shared instance keeps HTTP connections warm
+# across concurrent critiques
+_MODEL = None
+
+def get_model():
+    """Configure the Gemini SDK and construct the model on first use."""
+    global _MODEL
+    if _MODEL is None:
+        genai.configure(api_key=os.environ["GEMINI_API_KEY"])
+        _MODEL = genai.GenerativeModel(CONFIG["gemini_model"])
+    return _MODEL
+
+
+def prepare_upload_image(image_path: str) -> str:
+    """Downscale and compress a capture before it goes to Gemini.
+
+    The display is only 240x135, so a multi-megapixel phone capture
+    carries no extra signal. Anything wider than 480px is resized to fit
+    480x270 and re-encoded as JPEG q=85, typically cutting upload bytes
+    by 10-100x. Without Pillow the original is uploaded unchanged.
+    """
+    if not PIL_AVAILABLE:
+        return image_path
+
+    with Image.open(image_path) as im:
+        if im.width <= 480:
+            return image_path
+
+        # Name by content hash: same-named captures from different
+        # directories must not overwrite each other's resized copy while
+        # concurrent critique tasks are mid-upload
+        hasher = hashlib.sha256()
+        with open(image_path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                hasher.update(chunk)
+        resized = CONFIG["captures_dir"] / ".critique_cache" / f"{hasher.hexdigest()}.upload.jpg"
+
+        if not resized.exists():
+            im = im.convert("RGB")
+            im.thumbnail((480, 270), Image.LANCZOS)
+            resized.parent.mkdir(parents=True, exist_ok=True)
+            im.save(resized, "JPEG", quality=85, optimize=True)
+            print(f"🗜️  Downscaled for upload: {image_path} → {resized.name}")
+
+    return str(resized)
+
+
+def critique_cache_path(image_path: str) -> Path:
+    """Cache file for an image, keyed by content hash + prompt + model."""
+    # Hash in 1 MiB chunks so peak memory stays at one chunk even for
+    # multi-megabyte captures on slow storage
+    hasher = hashlib.sha256()
+    with open(image_path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            hasher.update(chunk)
+    hasher.update(CRITIC_PROMPT.encode())
+    hasher.update(CONFIG["gemini_model"].encode())
+    return CONFIG["captures_dir"] / ".critique_cache" / f"{hasher.hexdigest()}.json"
+
+
+def save_critique_cache(cache_path: Path, critique: dict):
+    """Write a critique to the cache atomically (tmp file + rename)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".json.tmp")
+    with open(tmp, "w") as f:
+        f.write(json_dumps(critique, indent=True))
+    tmp.replace(cache_path)
+
+
+async def critique_image_async(image_path: str) -> dict:
+    """Send image to Gemini Vision and get aesthetic critique (async)."""
     if not GEMINI_AVAILABLE:
         print("ERROR: Gemini not available. Install with: pip install google-generativeai")
         return None
@@ -251,15 +538,35 @@ def critique_image(image_path: str) -> dict:
         print("ERROR: GEMINI_API_KEY environment variable not set")
         return None
 
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel(CONFIG["gemini_model"])
+    # Shrink oversized captures first; caching below keys on the resized
+    # bytes, so repeats of the same original still hit
+    image_path = prepare_upload_image(image_path)
 
-    # Upload and analyze image
-    print(f"📸 Uploading image to Gemini: {image_path}")
-    image_file = genai.upload_file(image_path)
+    # Identical image + prompt + model means an identical critique:
+    # skip the upload and quota hit entirely
+    cache_path = None
+    if CONFIG["use_cache"]:
+        cache_path = critique_cache_path(image_path)
+        if cache_path.exists():
+            print(f"💾 Cached critique hit: {image_path}")
+            with open(cache_path) as f:
+                return json_loads(f.read())
 
-    print("🔍 Analyzing aesthetics...")
-    response = model.generate_content([image_file, CRITIC_PROMPT])
+    model = get_model()
+
+    sem, limiter = gemini_throttle()
+    async with sem:
+        await limiter.acquire()
+
+        # Upload and analyze image (upload is blocking in the SDK, so push it
+        # to a thread; generation has a native async entry point)
+        print(f"📸 Uploading image to Gemini: {image_path}")
+        image_file = await asyncio.to_thread(genai.upload_file, image_path)
+
+        print("🔍 Analyzing aesthetics...")
+        response = await with_retry(
+            lambda: model.generate_content_async([image_file, CRITIC_PROMPT])
+        )
 
     # Parse JSON from response
     try:
@@ -270,13 +577,27 @@ def critique_image(image_path: str) -> dict:
             text = text.split("```")[1]
             if text.startswith("json"):
                 text = text[4:]
-        return json.loads(text)
-    except json.JSONDecodeError as e:
+        critique = json_loads(text)
+        if cache_path is not None:
+            save_critique_cache(cache_path, critique)
+        return critique
+    except ValueError as e:  # json.JSONDecodeError and orjson's both subclass this
         print(f"Warning: Could not parse JSON response: {e}")
         print(f"Raw response: {response.text}")
         return {"raw_response": response.text, "parse_error": str(e)}
 
 
+async def critique_images_async(image_paths: list) -> list:
+    """Critique several captures concurrently instead of one round-trip at a time."""
+    tasks = [critique_image_async(p) for p in image_paths]
+    return await asyncio.gather(*tasks)
+
+
+def critique_image(image_path: str) -> dict:
+    """Sync wrapper around critique_image_async for CLI / external callers."""
+    return asyncio.run(critique_image_async(image_path))
+
+
 # ============================================================================
 # CLAUDE CODE MUTATOR - Modifies the simulation code
 # ============================================================================
@@ -310,7 +631,7 @@ Your task: Modify the CitySim simulation to improve the scores based on this fee
 Focus on the lowest-scoring aspects first. Make 1-3 targeted improvements.
 """
 
-def mutate_code(critique: dict) -> bool:
+async def mutate_code(critique: dict, cwd: Path = None) -> bool:
     """Use Claude Code to mutate the simulation based on critique."""
     if not critique or "scores" not in critique:
         print("ERROR: Invalid critique data")
@@ -330,16 +651,22 @@ def mutate_code(critique: dict) -> bool:
     print("🧬 Invoking Claude Code for mutation...")
     print(f"   Prompt length: {len(prompt)} chars")
 
-    # Run claude code CLI
-    result = subprocess.run(
-        ["claude", "-p", prompt],
-        cwd=CONFIG["project_root"],
-        capture_output=True,
-        text=True
-    )
+    async def run_claude():
+        # Async subprocess so retry sleeps don't block the event loop
+        proc = await asyncio.create_subprocess_exec(
+            "claude", "-p", prompt,
+            cwd=cwd or CONFIG["project_root"],
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"Claude Code failed: {stderr.decode(errors='replace')}")
 
-    if result.returncode != 0:
-        print(f"ERROR: Claude Code failed: {result.stderr}")
+    try:
+        await with_retry(run_claude)
+    except (RuntimeError, OSError) as e:
+        print(f"ERROR: {e}")
         return False
 
     print("✅ Mutation complete")
@@ -350,20 +677,84 @@ def mutate_code(critique: dict) -> bool:
 # PLATFORMIO DEPLOYER - Compiles and flashes to ESP32
 # ============================================================================
 
-def build_and_flash(skip_flash: bool = False) -> bool:
+def pio_build_env(cwd: Path = None) -> dict:
+    """Environment for PlatformIO builds: shared build cache + ccache.
+
+    Branch switches invalidate .pio/build, so every generation paid a
+    full cold build. PLATFORMIO_BUILD_CACHE_DIR keeps compiled objects
+    across generations, and when ccache is installed an extra script
+    wraps CC/CXX so framework and library objects hit the compiler
+    cache even after a cache miss at the PlatformIO layer.
+    """
+    root = CONFIG["project_root"]
+    # The SCons workspace must be per-worktree: concurrent fan-out
+    # candidates building through one workspace clobber each other's
+    # objects. The compiler caches below are safe to share (ccache
+    # locks; the PlatformIO cache is content-addressed).
+    workspace = f"workspace-{cwd.name}" if cwd else "workspace"
+    env = {
+        **os.environ,
+        "PLATFORMIO_BUILD_CACHE_DIR": str(root / ".pio_cache"),
+        # Keep libdeps and the workspace outside the branch-switched tree
+        # so checkouts between generations don't trigger re-downloads
+        "PLATFORMIO_LIBDEPS_DIR": str(root / ".pio-shared" / "libdeps"),
+        "PLATFORMIO_WORKSPACE_DIR": str(root / ".pio-shared" / workspace),
+    }
+    if shutil.which("ccache"):
+        env.update({
+            "PLATFORMIO_EXTRA_SCRIPTS": str(Path(__file__).parent / "ccache_wrap.py"),
+            "CCACHE_DIR": str(root / ".ccache"),
+            "CCACHE_BASEDIR": str(root),
+            "CCACHE_SLOPPINESS": "pch_defines,time_macros",
+            "CCACHE_MAXSIZE": "2G",
+        })
+    return env
+
+
+def tail_log(log_path: Path, lines: int = 200) -> str:
+    """Last N lines of a build log, for error reports."""
+    try:
+        with open(log_path, errors="replace") as f:
+            return "".join(f.readlines()[-lines:])
+    except OSError:
+        return "(log unavailable)"
+
+
+async def run_pio(target_args: list, cwd: Path = None, log_name: str = "build") -> tuple:
+    """Run a PlatformIO command, streaming output to a rolling log file.
+
+    Compiler output goes to disk line-by-line instead of piling up in a
+    capture_output buffer, so long builds show up in the log as they run
+    and the event loop stays free for concurrent work.
+    """
+    log_dir = CONFIG["project_root"] / ".pio-shared" / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_path = log_dir / f"{log_name}.log"
+
+    proc = await asyncio.create_subprocess_exec(
+        "python", "-m", "platformio", "run", "-e", CONFIG["platformio_env"], *target_args,
+        cwd=cwd or CONFIG["project_root"],
+        env=pio_build_env(cwd),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    with open(log_path, "w") as log:
+        async for line in proc.stdout:
+            log.write(line.decode(errors="replace"))
+    await proc.wait()
+    return proc.returncode, log_path
+
+
+async def build_and_flash(skip_flash: bool = False, cwd: Path = None) -> bool:
     """Compile and upload to ESP32 using PlatformIO."""
-    print("🔨 Building with PlatformIO...")
+    # Per-worktree log names so parallel candidate builds don't collide
+    suffix = f"-{cwd.name}" if cwd else ""
 
-    # Build
-    result = subprocess.run(
-        ["python", "-m", "platformio", "run", "-e", CONFIG["platformio_env"]],
-        cwd=CONFIG["project_root"],
-        capture_output=True,
-        text=True
-    )
+    print("🔨 Building with PlatformIO...")
+    returncode, log_path = await run_pio([], cwd=cwd, log_name=f"build{suffix}")
 
-    if result.returncode != 0:
-        print(f"ERROR: Build failed:\n{result.stderr}")
+    if returncode != 0:
+        print(f"ERROR: Build failed (full log: {log_path}):\n{tail_log(log_path)}")
         return False
 
     print("✅ Build successful")
@@ -373,17 +764,10 @@ def build_and_flash(skip_flash: bool = False) -> bool:
         return True
 
     print("📤 Uploading to ESP32...")
+    returncode, log_path = await run_pio(["-t", "upload"], cwd=cwd, log_name=f"upload{suffix}")
 
-    # Upload
-    result = subprocess.run(
-        ["python", "-m", "platformio", "run", "-e", CONFIG["platformio_env"], "-t", "upload"],
-        cwd=CONFIG["project_root"],
-        capture_output=True,
-        text=True
-    )
-
-    if result.returncode != 0:
-        print(f"ERROR: Upload failed:\n{result.stderr}")
+    if returncode != 0:
+        print(f"ERROR: Upload failed (full log: {log_path}):\n{tail_log(log_path)}")
         return False
 
     print("✅ Deployed to ESP32")
@@ -394,6 +778,28 @@ def build_and_flash(skip_flash: bool = False) -> bool:
 # EVOLUTION LOOP
 # ============================================================================
 
+def history_path(line: str) -> Path:
+    """Append-only score index for an evolution line."""
+    return CONFIG["generations_dir"] / line / "history.jsonl"
+
+
+def load_history(line: str) -> list:
+    """Read a line's score history in one sequential pass (no per-gen globbing)."""
+    path = history_path(line)
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [json_loads(l) for l in f if l.strip()]
+
+
+def get_previous_overall(line: str, generation: int):
+    """Parent generation's overall score from the JSONL index, or None."""
+    for entry in reversed(load_history(line)):
+        if entry.get("gen") == generation - 1:
+            return entry.get("overall")
+    return None
+
+
 def save_generation(line: str, generation: int, critique: dict):
     """Save generation data for history tracking."""
     gen_dir = CONFIG["generations_dir"] / line
@@ -410,29 +816,109 @@ def save_generation(line: str, generation: int, critique: dict):
 
     filepath = gen_dir / f"gen_{generation:03d}.json"
     with open(filepath, "w") as f:
-        json.dump(data, f, indent=2)
+        f.write(json_dumps(data, indent=True))
+
+    # Also append a one-line summary so score-over-time tooling reads a
+    # single file sequentially instead of opening every gen_*.json
+    entry = {
+        "gen": generation,
+        "ts": timestamp,
+        "scores": critique.get("scores", {}),
+        "overall": critique.get("overall_score"),
+    }
+    with open(history_path(line), "a") as f:
+        f.write(json_dumps(entry) + "\n")
 
     print(f"📁 Saved generation data to {filepath}")
 
 
-def run_evolution_cycle(image_path: str, line: str, generation: int, skip_flash: bool = False) -> dict:
+async def run_mutation_fanout(line: str, generation: int, critique: dict, fanout: int) -> bool:
+    """Explore several mutation candidates for one generation in parallel.
+
+    Each candidate gets its own branch (evo-{line}-{gen:03d}-cand{i}) and
+    worktree, and an independent Claude mutation runs in each. Aesthetic
+    scoring needs a physical capture, so candidate fitness here is
+    "builds cleanly": the first candidate whose mutation compiles is
+    renamed to the canonical generation branch and the losers are deleted.
+    """
+    canonical = get_branch_name(line, generation)
+    parent = get_parent_branch(line, generation)
+
+    # Set up candidate worktrees
+    candidates = []
+    for i in range(fanout):
+        cand_branch = f"{canonical}-cand{i}"
+        wt_path = CONFIG["worktrees_dir"] / cand_branch
+        wt_path.parent.mkdir(parents=True, exist_ok=True)
+        if not wt_path.exists():
+            print(f"🌿 Candidate {i}: worktree {cand_branch} from {parent}")
+            # -B resets a stale candidate branch left behind by a crashed run
+            git_run("worktree", "add", "-B", cand_branch, str(wt_path), parent)
+        candidates.append((cand_branch, wt_path))
+
+    async def mutate_and_build(wt_path: Path) -> bool:
+        if not await mutate_code(critique, cwd=wt_path):
+            return False
+        # Build only - flashing K candidates to one device makes no sense
+        return await build_and_flash(skip_flash=True, cwd=wt_path)
+
+    results = await asyncio.gather(
+        *(mutate_and_build(wt) for _, wt in candidates)
+    )
+
+    # Promote the first clean builder, drop the rest
+    winner = None
+    for (cand_branch, wt_path), ok in zip(candidates, results):
+        if ok and winner is None:
+            commit_generation(line, generation, critique, cwd=wt_path)
+            winner = cand_branch
+        git_run("worktree", "remove", "--force", str(wt_path), check=False)
+        if cand_branch != winner:
+            git_run("branch", "-D", cand_branch, check=False)
+
+    if winner is None:
+        print("❌ No candidate produced a building mutation")
+        return False
+
+    # -M overwrites a canonical branch left behind by a crashed run
+    git_run("branch", "-M", winner, canonical)
+    print(f"🏆 {winner} promoted to {canonical}")
+    return True
+
+
+async def run_evolution_cycle(image_path: str, line: str, generation: int,
+                              skip_flash: bool = False, use_worktree: bool = False,
+                              fanout: int = 1, critique_task: asyncio.Task = None) -> dict:
     """Run one complete evolution cycle."""
     print(f"\n{'='*60}")
     print(f"🧬 GENERATION {generation} (line: {line})")
     print(f"{'='*60}\n")
 
-    # Step 0: Create branch for this generation
+    # Step 0: Create branch (or isolated worktree) for this generation
     print("PHASE 0: BRANCH SETUP")
+    workdir = None
+    branch = get_branch_name(line, generation)
     try:
-        branch = create_generation_branch(line, generation)
-        print(f"   On branch: {branch}\n")
+        if not CONFIG["use_branches"]:
+            print("   Branch management disabled (--no-branches)\n")
+        elif fanout > 1:
+            # Candidates branch from the parent themselves; nothing to check out
+            branch = get_branch_name(line, generation)
+            print(f"   Fan-out mode: {fanout} candidates for {branch}\n")
+        elif use_worktree:
+            workdir = create_generation_worktree(line, generation)
+            branch = get_branch_name(line, generation)
+            print(f"   Worktree: {workdir}\n")
+        else:
+            branch = create_generation_branch(line, generation)
+            print(f"   On branch: {branch}\n")
     except RuntimeError as e:
         print(f"❌ Git error: {e}")
         return None
 
-    # Step 1: Critique
+    # Step 1: Critique (possibly already in flight from the pipeline)
     print("PHASE 1: CRITIQUE")
-    critique = critique_image(image_path)
+    critique = await (critique_task if critique_task else critique_image_async(image_path))
     if not critique:
         print("❌ Critique failed")
         return None
@@ -443,21 +929,57 @@ def run_evolution_cycle(image_path: str, line: str, generation: int, skip_flash:
     # Save generation data
     save_generation(line, generation, critique)
 
+    # Regression guard: if this capture scored clearly worse than the
+    # parent generation, don't spend the mutate+build+flash cycle on it
+    previous = get_previous_overall(line, generation)
+    overall = critique.get("overall_score")
+    if (isinstance(previous, (int, float)) and isinstance(overall, (int, float))
+            and overall < previous - CONFIG["regress_tolerance"]):
+        print(f"\n⛔ Regression: overall {overall} vs parent {previous} "
+              f"(tolerance {CONFIG['regress_tolerance']})")
+        if CONFIG["use_branches"] and fanout <= 1:
+            rejected = f"{branch}-rejected"
+            git_run("reset", "--hard", get_parent_branch(line, generation),
+                    check=False, cwd=workdir)
+            if workdir is not None:
+                # Release the branch first: leaving the worktree behind
+                # would make a retry of this generation silently reuse it
+                # and commit onto the -rejected branch
+                git_run("worktree", "remove", "--force", str(workdir), check=False)
+            git_run("branch", "-m", branch, rejected, check=False)
+            print(f"   Branch reset and marked {rejected}")
+        print("   Skipping mutate/build/flash for this generation.")
+        return critique
+
+    # Fan-out mode handles mutate/build/commit per candidate
+    if fanout > 1:
+        print(f"\nPHASE 2-4: MUTATION FAN-OUT ({fanout} candidates)")
+        try:
+            if not await run_mutation_fanout(line, generation, critique, fanout):
+                return critique
+        except RuntimeError as e:
+            print(f"❌ Git error: {e}")
+            return critique
+        print(f"\n✅ Generation {generation} complete (fan-out)")
+        print(f"   Check out {get_branch_name(line, generation)} and flash to evaluate.")
+        return critique
+
     # Step 2: Mutate
     print("\nPHASE 2: MUTATE")
-    if not mutate_code(critique):
+    if not await mutate_code(critique, cwd=workdir):
         print("❌ Mutation failed")
         return critique
 
     # Step 3: Build & Deploy
     print("\nPHASE 3: BUILD & DEPLOY")
-    if not build_and_flash(skip_flash):
+    if not await build_and_flash(skip_flash, cwd=workdir):
         print("❌ Build/Deploy failed")
         return critique
 
     # Step 4: Commit
-    print("\nPHASE 4: COMMIT")
-    commit_generation(line, generation, critique)
+    if CONFIG["use_branches"]:
+        print("\nPHASE 4: COMMIT")
+        commit_generation(line, generation, critique, cwd=workdir)
 
     print(f"\n{'='*60}")
     print(f"✅ Generation {generation} complete!")
@@ -469,11 +991,39 @@ def run_evolution_cycle(image_path: str, line: str, generation: int, skip_flash:
     return critique
 
 
+async def run_evolution_pipeline(images: list, line: str, start_gen: int,
+                                 skip_flash: bool = False, use_worktree: bool = False,
+                                 fanout: int = 1) -> dict:
+    """Run consecutive generations over several captures, pipelined.
+
+    Generations must run in order (each branches from the last), but the
+    critiques are independent network calls: all of them are launched up
+    front, so while generation N is building and flashing, the critiques
+    for N+1.. are already in flight and their latency hides behind the
+    build time.
+    """
+    tasks = [asyncio.create_task(critique_image_async(p)) for p in images]
+    critique = None
+    try:
+        for offset, (path, task) in enumerate(zip(images, tasks)):
+            critique = await run_evolution_cycle(
+                path, line, start_gen + offset, skip_flash,
+                use_worktree=use_worktree, fanout=fanout, critique_task=task,
+            )
+            if critique is None:
+                print("⛔ Pipeline stopped: cycle failed")
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+    return critique
+
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
 
-def main():
+async def main_async():
     parser = argparse.ArgumentParser(
         description="Evolve the city screensaver using AI feedback",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -486,7 +1036,7 @@ Examples:
   python evolve.py --critique-only screenshot.jpg   # Just get scores
         """
     )
-    parser.add_argument("image", nargs="?", help="Path to screenshot image")
+    parser.add_argument("image", nargs="*", help="Path to screenshot image(s)")
     parser.add_argument("--line", "-l", default=CONFIG["default_line"],
                         help=f"Evolution line name (default: {CONFIG['default_line']})")
     parser.add_argument("--gen", "-g", type=int, default=None,
@@ -497,27 +1047,67 @@ Examples:
                         help="Skip the flash step")
     parser.add_argument("--status", action="store_true",
                         help="Show evolution status")
+    parser.add_argument("--rpm", type=float, default=CONFIG["rpm"],
+                        help=f"Gemini requests per minute (default: {CONFIG['rpm']})")
+    parser.add_argument("--concurrency", type=int, default=CONFIG["max_concurrency"],
+                        help=f"Max simultaneous Gemini requests (default: {CONFIG['max_concurrency']})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always re-query Gemini, ignoring cached critiques")
+    parser.add_argument("--worktree", action="store_true",
+                        help="Run the generation in an isolated git worktree")
+    parser.add_argument("--fanout", type=int, default=1,
+                        help="Mutation candidates to explore in parallel (default: 1)")
+    parser.add_argument("--regress-tolerance", type=float, default=CONFIG["regress_tolerance"],
+                        help="Allowed overall-score drop vs parent before rejecting "
+                             f"(default: {CONFIG['regress_tolerance']})")
+    parser.add_argument("--no-branches", action="store_true",
+                        help="Simple flow: critique/mutate/build in place, no git branches")
+    parser.add_argument("--bootstrap-shallow", metavar="DEST",
+                        help="Shallow-clone the seed snapshot into DEST and exit")
 
     args = parser.parse_args()
 
+    CONFIG["rpm"] = args.rpm
+    CONFIG["max_concurrency"] = args.concurrency
+    CONFIG["use_cache"] = not args.no_cache
+    CONFIG["regress_tolerance"] = args.regress_tolerance
+    CONFIG["use_branches"] = not args.no_branches
+    if args.no_branches and args.fanout > 1:
+        print("⚠️  --fanout needs branch management; ignoring it with --no-branches")
+        args.fanout = 1
+
     # Ensure directories exist
     CONFIG["captures_dir"].mkdir(exist_ok=True)
     CONFIG["generations_dir"].mkdir(exist_ok=True)
 
     # Status command
     if args.status:
-        show_evolution_status()
+        await show_evolution_status()
+        return
+
+    # Bootstrap command
+    if args.bootstrap_shallow:
+        try:
+            bootstrap_shallow(args.bootstrap_shallow)
+        except RuntimeError as e:
+            print(f"❌ Git error: {e}")
+            sys.exit(1)
         return
 
     # Find image
     if not args.image:
-        # Look for most recent capture
-        captures = list(CONFIG["captures_dir"].glob("*.jpg")) + \
-                   list(CONFIG["captures_dir"].glob("*.png")) + \
-                   list(CONFIG["captures_dir"].glob("*.jpeg"))
-        if captures:
-            args.image = str(max(captures, key=os.path.getmtime))
-            print(f"Using most recent capture: {args.image}")
+        # Look for most recent capture - one scandir pass, one stat per
+        # file, instead of three globs plus a getmtime re-stat
+        best, best_mtime = None, -1.0
+        with os.scandir(CONFIG["captures_dir"]) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith((".jpg", ".jpeg", ".png")):
+                    mtime = entry.stat().st_mtime
+                    if mtime > best_mtime:
+                        best, best_mtime = entry.path, mtime
+        if best:
+            args.image = [best]
+            print(f"Using most recent capture: {best}")
         else:
             print("Usage: python evolve.py [options] <screenshot.jpg>")
             print(f"\nPlace screenshots in: {CONFIG['captures_dir']}")
@@ -530,15 +1120,27 @@ Examples:
         args.gen = get_latest_generation(args.line) + 1
         print(f"Auto-detected generation: {args.gen}")
 
-    # Critique only mode
+    # Critique only mode - batches of images run concurrently
     if args.critique_only:
-        critique = critique_image(args.image)
-        if critique:
-            print("\n" + json.dumps(critique, indent=2))
+        critiques = await critique_images_async(args.image)
+        for path, critique in zip(args.image, critiques):
+            if critique:
+                print(f"\n{path}:")
+                print(json_dumps(critique, indent=True))
         return
 
-    # Full evolution cycle
-    run_evolution_cycle(args.image, args.line, args.gen, args.skip_flash)
+    # Full evolution cycle; several images pipeline into consecutive
+    # generations with critiques prefetched behind the builds
+    if len(args.image) > 1:
+        await run_evolution_pipeline(args.image, args.line, args.gen, args.skip_flash,
+                                     use_worktree=args.worktree, fanout=args.fanout)
+    else:
+        await run_evolution_cycle(args.image[0], args.line, args.gen, args.skip_flash,
+                                  use_worktree=args.worktree, fanout=args.fanout)
+
+
+def main():
+    asyncio.run(main_async())
 
 
 if __name__ == "__main__":